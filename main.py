@@ -1,15 +1,31 @@
 import asyncio
+import logging
 import os
 import sys
+from logging.handlers import MemoryHandler
 from dotenv import load_dotenv
 from src.graph import CompliancePipeline
 
 
+def setup_logging():
+    """Buffer pipeline log lines so hot nodes don't pay a syscall per message.
+
+    The MemoryHandler flushes every 256 records, immediately on errors, and
+    at interpreter shutdown.
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    buffered_handler = MemoryHandler(capacity=256, flushLevel=logging.ERROR, target=stream_handler)
+    logging.basicConfig(level=logging.INFO, handlers=[buffered_handler])
+
+
 async def main():
     """Main entry point for the compliance evidence pipeline."""
-    
+
     # Load environment variables
     load_dotenv()
+
+    setup_logging()
     
     # Get Gemini API key
     api_key = os.getenv("GEMINI_API_KEY")
@@ -19,46 +35,51 @@ async def main():
         print("Copy .env.example to .env and add your API key.")
         sys.exit(1)
     
-    # Get URL from command line arguments or prompt
+    # Get URLs from command line arguments or prompt
     if len(sys.argv) > 1:
-        url = sys.argv[1]
+        urls = sys.argv[1:]
     else:
-        url = input("Enter the website URL to analyze: ").strip()
-    
-    if not url:
+        urls = [input("Enter the website URL to analyze: ").strip()]
+
+    urls = [url for url in urls if url]
+    if not urls:
         print("Error: No URL provided.")
         sys.exit(1)
-    
-    # Ensure URL has protocol
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-    
+
+    # Ensure URLs have protocol
+    urls = [url if url.startswith(('http://', 'https://')) else 'https://' + url for url in urls]
+
     try:
-        # Initialize and run pipeline
-        pipeline = CompliancePipeline(api_key)
-        result = await pipeline.run(url)
-        
+        # Initialize and run pipeline (batched extraction for multiple URLs);
+        # the context manager keeps one Chromium alive for the whole run
+        async with CompliancePipeline(api_key) as pipeline:
+            if len(urls) == 1:
+                results = [await pipeline.run(urls[0])]
+            else:
+                results = await pipeline.run_batch(urls)
+
         # Display results
-        print("\n" + "="*50)
-        print("EXTRACTION RESULTS")
-        print("="*50)
-        
-        if result.get("extracted_data"):
-            data = result["extracted_data"]
-            print(f"Company Name: {data.get('company_name', 'Not found')}")
-            print(f"Contact Email: {data.get('contact_email', 'Not found')}")
-            print(f"Phone Number: {data.get('phone_number', 'Not found')}")
-            print(f"Address: {data.get('address', 'Not found')}")
-            print(f"About Us: {data.get('about_us_text', 'Not found')[:200]}{'...' if len(data.get('about_us_text', '')) > 200 else ''}")
-        else:
-            print("No data was extracted successfully.")
-        
-        print(f"\nValidation Status: {'Success' if result.get('validated') else 'Failed'}")
-        print(f"Retry Attempts: {result.get('retry_count', 0)}")
-        
-        if result.get("report"):
-            print(f"\nReport saved to: reports/")
-        
+        for result in results:
+            print("\n" + "="*50)
+            print(f"EXTRACTION RESULTS: {result.get('url', '')}")
+            print("="*50)
+
+            if result.get("extracted_data"):
+                data = result["extracted_data"]
+                print(f"Company Name: {data.get('company_name', 'Not found')}")
+                print(f"Contact Email: {data.get('contact_email', 'Not found')}")
+                print(f"Phone Number: {data.get('phone_number', 'Not found')}")
+                print(f"Address: {data.get('address', 'Not found')}")
+                print(f"About Us: {data.get('about_us_text', 'Not found')[:200]}{'...' if len(data.get('about_us_text', '')) > 200 else ''}")
+            else:
+                print("No data was extracted successfully.")
+
+            print(f"\nValidation Status: {'Success' if result.get('validated') else 'Failed'}")
+            print(f"Retry Attempts: {result.get('retry_count', 0)}")
+
+            if result.get("report"):
+                print(f"\nReport saved to: reports/")
+
     except Exception as e:
         print(f"Pipeline failed: {str(e)}")
         sys.exit(1)
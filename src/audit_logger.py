@@ -1,10 +1,13 @@
+import logging
 import os
-import json
+import orjson
 import hashlib
 from datetime import datetime
 from typing import Dict, Any
 from .state import PipelineState
 
+logger = logging.getLogger(__name__)
+
 
 class AuditLogger:
     """Handles comprehensive audit logging for the pipeline."""
@@ -13,14 +16,18 @@ class AuditLogger:
         self.logs_dir = logs_dir
         os.makedirs(logs_dir, exist_ok=True)
         self.log_file = os.path.join(logs_dir, f"audit_{datetime.now().strftime('%Y%m%d')}.jsonl")
+        # Persistent buffered handle avoids an open+close syscall pair per log line
+        self._fh = open(self.log_file, 'ab', buffering=64 * 1024)
     
     def log_node_execution(self, node_name: str, state: PipelineState, status: str, error: str = None) -> None:
         """Log the execution of a pipeline node."""
         timestamp = datetime.now().isoformat()
         
-        # Create input and output hashes for integrity checking
-        input_hash = self._create_hash(str(state))
-        output_hash = self._create_hash(str(state.get("extracted_data", "")))
+        # Create input and output hashes for integrity checking. Only small
+        # identifying fields are hashed here; the html payload is hashed once
+        # at collection time and referenced via its cached digest.
+        input_hash = self._create_hash(self._state_fingerprint(state))
+        output_hash = self._create_hash(orjson.dumps(state.get("extracted_data") or {}, option=orjson.OPT_SORT_KEYS))
         
         log_entry = {
             "timestamp": timestamp,
@@ -36,15 +43,36 @@ class AuditLogger:
         if error:
             log_entry["error"] = error
         
-        # Write to log file
-        with open(self.log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log_entry) + '\n')
-        
-        print(f"Audit log: {node_name} - {status}")
+        # Write to the buffered log handle (reopen if a previous run closed it)
+        if self._fh.closed:
+            self._fh = open(self.log_file, 'ab', buffering=64 * 1024)
+        self._fh.write(orjson.dumps(log_entry) + b'\n')
+
+        logger.info(f"Audit log: {node_name} - {status}")
+
+    def close(self) -> None:
+        """Flush buffered log entries to disk and close the handle."""
+        if not self._fh.closed:
+            self._fh.close()
     
-    def _create_hash(self, data: str) -> str:
-        """Create SHA256 hash for data integrity."""
-        return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+    def _state_fingerprint(self, state: PipelineState) -> bytes:
+        """Serialize the compact identifying fields of a state, never the html payload."""
+        fingerprint = {
+            "url": state.get("url", ""),
+            "retry_count": state.get("retry_count", 0),
+            "validated": state.get("validated", False),
+            "html_hash": state.get("_html_hash"),
+        }
+        return orjson.dumps(fingerprint, option=orjson.OPT_SORT_KEYS)
+
+    def _create_hash(self, data: bytes) -> str:
+        """Create SHA256 hash for data integrity.
+
+        Takes pre-encoded bytes so callers serializing with orjson skip a
+        str round-trip; for these small inputs the Python-level overhead
+        dominates the hash itself.
+        """
+        return hashlib.sha256(data).hexdigest()[:16]
     
     def get_pipeline_summary(self, state: PipelineState) -> Dict[str, Any]:
         """Get a summary of the pipeline execution."""
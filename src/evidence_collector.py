@@ -1,50 +1,110 @@
+import logging
 import os
+import asyncio
 import hashlib
 from datetime import datetime
 from typing import Dict, Any
 from playwright.async_api import async_playwright
 from .state import PipelineState
 
+logger = logging.getLogger(__name__)
+
+
+# Resource types that only matter for rendering, not for the HTML we extract
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+
 
 class EvidenceCollector:
     """Collects HTML evidence from websites using Playwright."""
-    
-    def __init__(self, evidence_dir: str = "evidence"):
+
+    def __init__(self, evidence_dir: str = "evidence", max_concurrent_pages: int = 50):
         self.evidence_dir = evidence_dir
         os.makedirs(evidence_dir, exist_ok=True)
-    
+        self._playwright = None
+        self.browser = None
+        self._semaphore = asyncio.Semaphore(max_concurrent_pages)
+
+    async def start(self) -> None:
+        """Launch one Chromium instance reused for every URL in this process."""
+        if self.browser is not None:
+            return
+        self._playwright = await async_playwright().start()
+        self.browser = await self._playwright.chromium.launch(
+            headless=True,
+            args=["--disable-dev-shm-usage", "--no-sandbox", "--disable-gpu"],
+        )
+
+    async def stop(self) -> None:
+        """Shut down the shared browser and Playwright driver."""
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self) -> "EvidenceCollector":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
     async def collect_evidence(self, state: PipelineState) -> PipelineState:
         """Collect HTML evidence from the given URL."""
-        url = state["url"]
-        
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            
+        if self.browser is None:
+            await self.start()
+
+        # Shared browser: one isolated context per URL, capped by the semaphore
+        async with self._semaphore:
+            context = await self.browser.new_context()
+            page = await context.new_page()
             try:
-                # Navigate to URL and wait for network idle
-                await page.goto(url, wait_until="networkidle")
-                
-                # Get HTML content
-                html = await page.content()
-                
-                # Save HTML to file
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                html_filename = f"raw_{timestamp}.html"
-                html_path = os.path.join(self.evidence_dir, html_filename)
-                
-                with open(html_path, 'w', encoding='utf-8') as f:
-                    f.write(html)
-                
-                # Update state
-                state["html"] = html
-                
-                print(f"Evidence collected: {html_path}")
-                
-            except Exception as e:
-                print(f"Error collecting evidence: {str(e)}")
-                raise
+                state = await self._capture_page(page, state)
             finally:
-                await browser.close()
-        
+                await context.close()
+
+        return state
+
+    async def _capture_page(self, page, state: PipelineState) -> PipelineState:
+        """Navigate to the state's URL and save the rendered HTML."""
+        url = state["url"]
+
+        try:
+            # Skip images/fonts/media/stylesheets; only the HTML is used downstream
+            await page.route(
+                "**/*",
+                lambda route: route.abort()
+                if route.request.resource_type in _BLOCKED_RESOURCE_TYPES
+                else route.continue_()
+            )
+
+            # Navigate to URL; DOM content is enough since we never render the page
+            await page.goto(url, wait_until="domcontentloaded")
+
+            # Get HTML content
+            html = await page.content()
+
+            # Save HTML to file (URL hash keeps concurrent captures from colliding)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            url_hash = hashlib.sha256(url.encode('utf-8')).hexdigest()[:8]
+            html_filename = f"raw_{timestamp}_{url_hash}.html"
+            html_path = os.path.join(self.evidence_dir, html_filename)
+
+            # Write pre-encoded bytes in one shot; a 1 MiB buffer means a single
+            # write(2) for typical page sizes instead of text-mode chunking
+            html_bytes = html.encode('utf-8')
+            with open(html_path, 'wb', buffering=1 << 20) as f:
+                f.write(html_bytes)
+
+            # Update state; hash the payload once here so audit logging never re-hashes it
+            state["html"] = html
+            state["_html_hash"] = hashlib.sha256(html_bytes).hexdigest()[:16]
+
+            logger.info(f"Evidence collected: {html_path}")
+
+        except Exception as e:
+            logger.error(f"Error collecting evidence: {str(e)}")
+            raise
+
         return state
@@ -1,4 +1,6 @@
-from typing import Dict, Any
+import logging
+import asyncio
+from typing import Dict, Any, List
 from langgraph.graph import StateGraph, END
 from .state import PipelineState
 from .evidence_collector import EvidenceCollector
@@ -7,6 +9,8 @@ from .validator import Validator
 from .report_generator import ReportGenerator
 from .audit_logger import AuditLogger
 
+logger = logging.getLogger(__name__)
+
 
 class CompliancePipeline:
     """Main pipeline orchestrator using LangGraph."""
@@ -20,6 +24,14 @@ class CompliancePipeline:
         
         # Build the graph
         self.graph = self._build_graph()
+
+    async def __aenter__(self) -> "CompliancePipeline":
+        """Pre-launch the shared browser for the lifetime of the pipeline."""
+        await self.evidence_collector.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.evidence_collector.stop()
     
     def _build_graph(self) -> StateGraph:
         """Build the LangGraph pipeline."""
@@ -65,10 +77,12 @@ class CompliancePipeline:
             self.audit_logger.log_node_execution("collect_evidence", state, "error", str(e))
             raise
     
-    def _extract_data_node(self, state: PipelineState) -> PipelineState:
+    async def _extract_data_node(self, state: PipelineState) -> PipelineState:
         """Node for extracting data."""
         try:
-            new_state = self.llm_extractor.extract_company_info(state)
+            # Gemini SDK calls are blocking; keep them off the event loop so
+            # concurrent URL runs can overlap their extractions
+            new_state = await asyncio.to_thread(self.llm_extractor.extract_company_info, state)
             self.audit_logger.log_node_execution("extract_data", new_state, "success")
             return new_state
         except Exception as e:
@@ -85,10 +99,10 @@ class CompliancePipeline:
             self.audit_logger.log_node_execution("validate_data", state, "error", str(e))
             raise
     
-    def _retry_extraction_node(self, state: PipelineState) -> PipelineState:
+    async def _retry_extraction_node(self, state: PipelineState) -> PipelineState:
         """Node for retrying extraction."""
         try:
-            new_state = self.llm_extractor.extract_with_retry(state)
+            new_state = await asyncio.to_thread(self.llm_extractor.extract_with_retry, state)
             self.audit_logger.log_node_execution("retry_extraction", new_state, "success")
             return new_state
         except Exception as e:
@@ -109,8 +123,9 @@ class CompliancePipeline:
         """Node for logging completion."""
         try:
             summary = self.audit_logger.get_pipeline_summary(state)
-            print(f"\nPipeline Summary: {summary}")
+            logger.info(f"\nPipeline Summary: {summary}")
             self.audit_logger.log_node_execution("pipeline_complete", state, "success")
+            self.audit_logger.close()
             return state
         except Exception as e:
             self.audit_logger.log_node_execution("pipeline_complete", state, "error", str(e))
@@ -122,21 +137,73 @@ class CompliancePipeline:
             return "retry"
         return "continue"
     
-    async def run(self, url: str) -> PipelineState:
-        """Run the complete pipeline."""
-        initial_state: PipelineState = {
+    def _initial_state(self, url: str) -> PipelineState:
+        """Create a fresh pipeline state for a URL."""
+        return {
             "url": url,
             "html": None,
+            "_html_hash": None,
+            "cleaned_html": None,
+            "potential_emails": None,
+            "potential_phones": None,
             "extracted_data": None,
             "validated": False,
             "retry_count": 0,
             "report": None
         }
-        
-        print(f"Starting pipeline for: {url}")
-        
+
+    async def run(self, url: str) -> PipelineState:
+        """Run the complete pipeline."""
+        initial_state = self._initial_state(url)
+
+        logger.info(f"Starting pipeline for: {url}")
+
         # Run the graph
         final_state = await self.graph.ainvoke(initial_state)
-        
-        print("Pipeline completed successfully!")
+
+        logger.info("Pipeline completed successfully!")
         return final_state
+
+    async def run_many(self, urls: List[str]) -> List[PipelineState]:
+        """Run the full graph concurrently for multiple URLs over one shared browser.
+
+        Browser shutdown is owned by the pipeline context manager.
+        """
+        states = [self._initial_state(url) for url in urls]
+
+        logger.info(f"Starting pipeline for {len(urls)} URLs")
+
+        # One Chromium launch amortized across all URLs; pages run concurrently
+        results = await asyncio.gather(*(self.graph.ainvoke(state) for state in states))
+
+        logger.info("Pipeline completed successfully!")
+        return list(results)
+
+    async def run_batch(self, urls: List[str]) -> List[PipelineState]:
+        """Run the pipeline for multiple URLs with one batched Gemini request."""
+        logger.info(f"Starting pipeline for {len(urls)} URLs")
+
+        # Collect all pages concurrently over the shared browser before
+        # submitting the batch job; the page semaphore caps the fan-out
+        states = list(await asyncio.gather(
+            *(self._collect_evidence_node(self._initial_state(url)) for url in urls)
+        ))
+
+        # One inline batch call replaces one generate_content call per URL;
+        # the job submission and polling are blocking, so run them in a thread
+        states = await asyncio.to_thread(self.llm_extractor.extract_company_info_batch, states)
+        for state in states:
+            self.audit_logger.log_node_execution("extract_data_batch", state, "success")
+
+        results = []
+        for state in states:
+            state = self._validate_data_node(state)
+            if self._should_retry_or_continue(state) == "retry":
+                state = await self._retry_extraction_node(state)
+                state = self._validate_data_node(state)
+            state = self._generate_report_node(state)
+            state = self._log_completion_node(state)
+            results.append(state)
+
+        logger.info("Pipeline completed successfully!")
+        return results
@@ -1,72 +1,183 @@
 import re
-from bs4 import BeautifulSoup
-from typing import Optional
+import orjson
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Optional, Dict
+
+
+# Raw HTML beyond this is never reflected in the 50 KB prompt cap, so parsing
+# it is wasted work; 300 KB of markup comfortably yields that much clean text
+_MAX_RAW_HTML = 300_000
+
+# Tags stripped from the tree before text extraction (footer kept for contact info)
+_REMOVE_TAGS = {"script", "style", "nav", "header", "aside"}
+
+# Build only the body subtree so head content (inline JSON-LD, analytics, CSS)
+# never enters the tree
+_BODY_STRAINER = SoupStrainer(['body', 'footer'])
+
+# Precompiled patterns (these run once per page, so avoid re-compilation per call)
+_WS_RE = re.compile(r'\s+')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# Single alternation so the text is scanned once instead of once per format
+# (international, US, German)
+_PHONES_RE = re.compile(
+    r'(\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+    r'|(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+    r'|(\+49[-.\s]?\d{3,4}[-.\s]?\d{7,8})'
+)
+_TITLE_RES = [
+    re.compile(r'(?:company|firma|unternehmen)[:\s]*([^\n]+)', re.IGNORECASE | re.MULTILINE),  # German/English
+    re.compile(r'^(.{1,50})$', re.IGNORECASE | re.MULTILINE),  # First line might be company name
+]
 
 
 class HTMLProcessor:
     """Preprocesses HTML to improve extraction accuracy."""
-    
+
     @staticmethod
     def clean_html(html: str) -> str:
         """Clean and preprocess HTML for better extraction."""
         if not html:
             return ""
-        
-        # Parse HTML
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Remove common non-content elements
-        for element in soup.find_all(['nav', 'header', 'footer', 'aside']):
-            # Keep footer as it might contain contact info
-            if element.name != 'footer':
-                element.decompose()
-        
+
+        # Pre-slice before parsing so libxml2 never walks multi-MB pages
+        if len(html) > _MAX_RAW_HTML:
+            html = html[:_MAX_RAW_HTML]
+
+        # Parse only the body subtree (lxml backend is ~10x faster than the
+        # pure-Python html.parser)
+        soup = BeautifulSoup(html, 'lxml', parse_only=_BODY_STRAINER)
+
+        # Remove scripts, styles, and non-content elements in a single tree walk.
+        # Footer is deliberately kept as it might contain contact info.
+        for element in soup.find_all(_REMOVE_TAGS):
+            element.decompose()
+
         # Get clean text
         text = soup.get_text()
-        
+
         # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WS_RE.sub(' ', text)
         text = text.strip()
-        
+
         return text
-    
+
+    @staticmethod
+    def fast_extract(html: str) -> Dict[str, Optional[str]]:
+        """Extract company fields directly from the DOM without an LLM.
+
+        Reads mailto:/tel: links, og:site_name/<title>, and schema.org JSON-LD.
+        Returns a dict with the CompanyInfo field names; missing fields are None.
+        """
+        result = {
+            "company_name": None,
+            "contact_email": None,
+            "phone_number": None,
+            "address": None,
+            "about_us_text": None,
+        }
+
+        if not html:
+            return result
+
+        # Cap the parse input like clean_html does; unlike clean_html the head
+        # is kept because og:site_name and JSON-LD usually live there
+        if len(html) > _MAX_RAW_HTML:
+            html = html[:_MAX_RAW_HTML]
+
+        soup = BeautifulSoup(html, 'lxml')
+
+        # Company name: og:site_name, falling back to <title>
+        meta = soup.select_one('meta[property="og:site_name"]')
+        if meta and meta.get('content'):
+            result["company_name"] = meta['content'].strip()
+        elif soup.title and soup.title.string:
+            result["company_name"] = soup.title.string.strip()
+
+        # Contact details from mailto:/tel: links
+        mailto = soup.select_one('a[href^="mailto:"]')
+        if mailto:
+            result["contact_email"] = mailto['href'][len('mailto:'):].split('?')[0].strip()
+
+        tel = soup.select_one('a[href^="tel:"]')
+        if tel:
+            result["phone_number"] = tel['href'][len('tel:'):].strip()
+
+        # schema.org JSON-LD Organization data
+        for script in soup.select('script[type="application/ld+json"]'):
+            node = HTMLProcessor._find_organization_node(script.string)
+            if not node:
+                continue
+            result["company_name"] = node.get("name") or result["company_name"]
+            result["contact_email"] = node.get("email") or result["contact_email"]
+            result["phone_number"] = node.get("telephone") or result["phone_number"]
+            result["address"] = HTMLProcessor._format_address(node.get("address")) or result["address"]
+            result["about_us_text"] = node.get("description") or result["about_us_text"]
+            break
+
+        return result
+
+    @staticmethod
+    def _find_organization_node(raw: Optional[str]) -> Optional[dict]:
+        """Find a schema.org Organization-like node in a JSON-LD payload."""
+        if not raw:
+            return None
+
+        try:
+            # bs4 hands back a NavigableString subclass, which orjson rejects;
+            # it must be downcast to a plain str before parsing
+            data = orjson.loads(str(raw))
+        except orjson.JSONDecodeError:
+            return None
+
+        candidates = data if isinstance(data, list) else [data]
+        for candidate in candidates:
+            if not isinstance(candidate, dict):
+                continue
+            # Nodes may be wrapped in an @graph list
+            for node in candidate.get("@graph", [candidate]):
+                if isinstance(node, dict) and "Organization" in str(node.get("@type", "")):
+                    return node
+
+        return None
+
+    @staticmethod
+    def _format_address(address) -> Optional[str]:
+        """Flatten a schema.org PostalAddress (or plain string) into one line."""
+        if isinstance(address, str):
+            return address.strip()
+
+        if isinstance(address, dict):
+            parts = [
+                address.get(key)
+                for key in ("streetAddress", "postalCode", "addressLocality", "addressCountry")
+            ]
+            joined = ', '.join(part.strip() for part in parts if isinstance(part, str))
+            return joined or None
+
+        return None
+
     @staticmethod
     def extract_potential_emails(text: str) -> list:
         """Extract potential email addresses from text."""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        return re.findall(email_pattern, text)
-    
+        return _EMAIL_RE.findall(text)
+
     @staticmethod
     def extract_potential_phones(text: str) -> list:
         """Extract potential phone numbers from text."""
-        phone_patterns = [
-            r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # International
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US format
-            r'\+49[-.\s]?\d{3,4}[-.\s]?\d{7,8}',  # German format
-        ]
-        
         phones = []
-        for pattern in phone_patterns:
-            phones.extend(re.findall(pattern, text))
-        
+        for match in _PHONES_RE.finditer(text):
+            phones.append(next(group for group in match.groups() if group))
+
         return phones
-    
+
     @staticmethod
     def extract_title(text: str) -> Optional[str]:
         """Extract potential company title from text."""
         # Look for common title patterns
-        title_patterns = [
-            r'(?:company|firma|unternehmen)[:\s]*([^\n]+)',  # German/English
-            r'^(.{1,50})$',  # First line might be company name
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+        for pattern in _TITLE_RES:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
-        
+
         return None
@@ -1,11 +1,95 @@
+import logging
 import os
-import json
-from typing import Dict, Any, Optional
+import orjson
+import time
+from typing import Dict, Any, Optional, List
 from pydantic import BaseModel, Field
 import google.genai as genai
 from .state import PipelineState
 from .html_processor import HTMLProcessor
 
+logger = logging.getLogger(__name__)
+
+
+# Terminal states for Gemini batch jobs
+_BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+
+# Static prompt blocks, built once at import; per-call code only concatenates
+# the variable context and HTML between them
+_EXTRACTION_PROMPT_HEAD = """
+Extract the following company information from the HTML content and return ONLY a valid JSON object.
+
+IMPORTANT: The content may be in English OR German. Handle both languages appropriately.
+
+Extract these fields:
+1. company_name: The official name of the company (look for logos, headers, titles, footer text)
+2. contact_email: Contact email address (look for email patterns like *@*.*, mailto: links, "Kontakt" sections)
+3. phone_number: Phone number (look for phone patterns, "Tel:", "Telefon:", international formats)
+4. address: Physical address or location information (look for address patterns, street names, cities)
+5. about_us_text: Any about us, company description, mission statement, or service descriptions (in original language)
+
+EXTRACTION TIPS:
+- Check headers, footers, navigation menus, and contact sections
+- Look for both English and German terms:
+  * Contact: "Contact", "Kontakt", "Reach us", "Kontaktieren Sie uns"
+  * About: "About", "About us", "Über uns", "Wir sind"
+  * Email: look for mailto: links, @ symbols, email addresses
+  * Legal: "Impressum" (German legal notice), "Datenschutz" (privacy policy)
+- Company names often appear in: <title>, <h1>, logos, footer copyright
+- For German content, preserve German text in about_us_text
+- Pay attention to the context information below
+
+CONTEXT INFORMATION:
+"""
+
+_EXTRACTION_PROMPT_TAIL = """
+
+Return ONLY a JSON object with these exact keys. If a field is not found, use null for that field.
+
+Example format:
+{
+    "company_name": "LeadLane",
+    "contact_email": "os@leadlane.de",
+    "phone_number": "+49-123-456789",
+    "address": "Street Name, City, Germany",
+    "about_us_text": "German or English description here..."
+}
+"""
+
+_RETRY_PROMPT_HEAD = """
+The previous extraction failed. Please try again with this HTML content and be very careful to return ONLY valid JSON.
+
+CRITICAL: This content may be in GERMAN or English. Look for both languages.
+
+Search specifically for:
+- Company name (usually in header, title, footer, or about section)
+- Email addresses (patterns like contact@, info@, support@, mailto: links)
+- Phone numbers (patterns like (xxx) xxx-xxxx, +x-xxx-xxx-xxxx, Tel:, Telefon:)
+- Address information (street, city, state, zip patterns, German addresses)
+- About us/description text (paragraphs describing the company, in original language)
+
+GERMAN-SPECIFIC SEARCH TERMS:
+- "Kontakt" = Contact
+- "Über uns" = About us
+- "Impressum" = Legal notice/imprint
+- "Datenschutz" = Privacy policy
+- "Sprechen Sie uns an" = Contact us
+- "Wir freuen uns" = We look forward to
+
+CONTEXT INFORMATION:
+"""
+
+_RETRY_PROMPT_TAIL = """
+
+Return ONLY a valid JSON object. No explanations, no markdown formatting, just the JSON.
+"""
+
 
 class CompanyInfo(BaseModel):
     """Pydantic schema for company information extraction."""
@@ -18,72 +102,171 @@ class CompanyInfo(BaseModel):
 
 class LLMExtractor:
     """Extracts structured company information using Gemini API."""
-    
+
     def __init__(self, api_key: str):
         self.client = genai.Client(api_key=api_key)
+        # Constrain responses to the CompanyInfo schema: guaranteed parseable
+        # JSON and no prose tokens wasted on explanations
+        self._json_config = {
+            "response_mime_type": "application/json",
+            "response_schema": CompanyInfo,
+        }
     
     def extract_company_info(self, state: PipelineState) -> PipelineState:
         """Extract company information from HTML using Gemini."""
-        html = state["html"]
-        
-        if not html:
-            raise ValueError("No HTML content available for extraction")
-        
-        # Preprocess HTML to improve extraction
-        cleaned_html = HTMLProcessor.clean_html(html)
-        
-        # Extract potential data for context
-        potential_emails = HTMLProcessor.extract_potential_emails(cleaned_html)
-        potential_phones = HTMLProcessor.extract_potential_phones(cleaned_html)
-        
-        # Create enhanced extraction prompt
-        prompt = self._create_extraction_prompt(cleaned_html, potential_emails, potential_phones)
-        
+        # Fast path: skip the LLM entirely when the DOM already carries all fields
+        if self._try_fast_extract(state):
+            return state
+
+        prompt = self._prepare_prompt(state)
+
         try:
             # Generate response from Gemini
             response = self.client.models.generate_content(
                 model="gemini-2.5-flash",
-                contents=prompt
+                contents=prompt,
+                config=self._json_config
+            )
+            if isinstance(response.parsed, CompanyInfo):
+                self._apply_parsed(state, response.parsed)
+            else:
+                self._apply_response(state, response.text)
+
+        except Exception as e:
+            logger.error(f"LLM extraction error: {str(e)}")
+            state["extracted_data"] = None
+            state["validated"] = False
+
+        return state
+
+    def extract_company_info_batch(self, states: List[PipelineState], poll_interval: float = 10.0) -> List[PipelineState]:
+        """Extract company information for multiple states with one inline batch request.
+
+        Batch mode is ~50% cheaper than per-URL generate_content calls and
+        amortizes rate limits, at the cost of polling latency.
+        """
+        # Fast path first; only states the DOM could not satisfy go to Gemini
+        pending = [state for state in states if not self._try_fast_extract(state)]
+        if not pending:
+            return states
+
+        prompts = [self._prepare_prompt(state) for state in pending]
+
+        try:
+            # Submit all prompts as one inline batch job
+            batch_job = self.client.batches.create(
+                model="gemini-2.5-flash",
+                src=[
+                    {
+                        "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                        "config": self._json_config,
+                    }
+                    for prompt in prompts
+                ],
+                config={"display_name": "compliance-extraction-batch"},
             )
-            response_text = response.text
-            
-            # Parse the JSON response
-            try:
-                # Try to extract JSON from the response
-                json_start = response_text.find('{')
-                json_end = response_text.rfind('}') + 1
-                
-                if json_start != -1 and json_end > json_start:
-                    json_str = response_text[json_start:json_end]
-                    extracted_data = json.loads(json_str)
+
+            # Poll until the job reaches a terminal state
+            while batch_job.state.name not in _BATCH_DONE_STATES:
+                time.sleep(poll_interval)
+                batch_job = self.client.batches.get(name=batch_job.name)
+
+            if batch_job.state.name != "JOB_STATE_SUCCEEDED":
+                raise RuntimeError(f"Batch job ended in state {batch_job.state.name}")
+
+            # Demultiplex responses back into their states
+            for state, inline_response in zip(pending, batch_job.dest.inlined_responses):
+                if inline_response.response is not None:
+                    self._apply_response(state, inline_response.response.text)
                 else:
-                    # If no JSON found, create empty structure
-                    extracted_data = {}
-                
-                # Validate with Pydantic
-                company_info = CompanyInfo(**extracted_data)
-                state["extracted_data"] = company_info.model_dump()
-                state["validated"] = True
-                
-                print("Company information extracted successfully")
-                
-            except json.JSONDecodeError as e:
-                print(f"JSON parsing error: {str(e)}")
-                state["validated"] = False
+                    logger.error(f"Batch extraction error for {state['url']}: {inline_response.error}")
+                    state["extracted_data"] = None
+                    state["validated"] = False
+
+        except Exception as e:
+            logger.error(f"Batch LLM extraction error: {str(e)}")
+            for state in pending:
                 state["extracted_data"] = None
-                
-            except Exception as e:
-                print(f"Validation error: {str(e)}")
                 state["validated"] = False
-                state["extracted_data"] = None
-                
-        except Exception as e:
-            print(f"LLM extraction error: {str(e)}")
+
+        return states
+
+    def _try_fast_extract(self, state: PipelineState) -> bool:
+        """Try CSS-selector extraction from the raw DOM before calling Gemini.
+
+        Only succeeds when every CompanyInfo field is present, so partial
+        matches still go through the LLM.
+        """
+        html = state["html"]
+
+        if not html:
+            return False
+
+        fast_data = HTMLProcessor.fast_extract(html)
+        if not all(fast_data.get(field) for field in CompanyInfo.model_fields):
+            return False
+
+        company_info = CompanyInfo(**fast_data)
+        state["extracted_data"] = company_info.model_dump()
+        state["validated"] = True
+
+        logger.info("Company information extracted from DOM, skipping LLM call")
+        return True
+
+    def _prepare_prompt(self, state: PipelineState) -> str:
+        """Clean the HTML (cached on state) and build the extraction prompt."""
+        html = state["html"]
+
+        if not html:
+            raise ValueError("No HTML content available for extraction")
+
+        # Preprocess HTML to improve extraction (cache on state so retries skip the re-parse)
+        cleaned_html = state.get("cleaned_html")
+        if cleaned_html is None:
+            cleaned_html = HTMLProcessor.clean_html(html)
+            state["cleaned_html"] = cleaned_html
+
+        # Extract potential data for context (also cached for retry)
+        potential_emails = state.get("potential_emails")
+        if potential_emails is None:
+            potential_emails = HTMLProcessor.extract_potential_emails(cleaned_html)
+            state["potential_emails"] = potential_emails
+
+        potential_phones = state.get("potential_phones")
+        if potential_phones is None:
+            potential_phones = HTMLProcessor.extract_potential_phones(cleaned_html)
+            state["potential_phones"] = potential_phones
+
+        return self._create_extraction_prompt(cleaned_html, potential_emails, potential_phones)
+
+    def _apply_parsed(self, state: PipelineState, company_info: CompanyInfo) -> None:
+        """Store a schema-constrained Gemini response on the state."""
+        state["extracted_data"] = company_info.model_dump()
+        state["validated"] = True
+
+        logger.info("Company information extracted successfully")
+
+    def _apply_response(self, state: PipelineState, response_text: str) -> None:
+        """Parse a JSON Gemini response and store the extracted data on the state."""
+        try:
+            # response_mime_type=application/json guarantees a bare JSON payload;
+            # no brace scanning needed
+            extracted_data = orjson.loads(response_text) if response_text else {}
+
+            # Validate with Pydantic
+            company_info = CompanyInfo(**extracted_data)
+            self._apply_parsed(state, company_info)
+
+        except orjson.JSONDecodeError as e:
+            logger.error(f"JSON parsing error: {str(e)}")
+            state["validated"] = False
             state["extracted_data"] = None
+
+        except Exception as e:
+            logger.error(f"Validation error: {str(e)}")
             state["validated"] = False
-        
-        return state
-    
+            state["extracted_data"] = None
+
     def _create_extraction_prompt(self, html: str, potential_emails: list = None, potential_phones: list = None) -> str:
         """Create the extraction prompt for Gemini."""
         # Truncate HTML if too long
@@ -91,129 +274,70 @@ class LLMExtractor:
         if len(html) > max_length:
             html = html[:max_length] + "..."
         
-        # Add context about found patterns
+        # Only the variable tail is assembled here; the instruction blocks are
+        # module-level constants built once at import
+        context = self._create_context(potential_emails, potential_phones)
+
+        return _EXTRACTION_PROMPT_HEAD + context + "\n\nHTML Content:\n" + html + _EXTRACTION_PROMPT_TAIL
+
+    @staticmethod
+    def _create_context(potential_emails: list = None, potential_phones: list = None) -> str:
+        """Format the regex-scan hints appended to the prompts."""
         context = ""
         if potential_emails:
             context += f"\nFound potential emails: {', '.join(potential_emails[:3])}"  # Limit to first 3
         if potential_phones:
             context += f"\nFound potential phones: {', '.join(potential_phones[:3])}"  # Limit to first 3
-        
-        prompt = f"""
-Extract the following company information from the HTML content and return ONLY a valid JSON object.
-
-IMPORTANT: The content may be in English OR German. Handle both languages appropriately.
-
-Extract these fields:
-1. company_name: The official name of the company (look for logos, headers, titles, footer text)
-2. contact_email: Contact email address (look for email patterns like *@*.*, mailto: links, "Kontakt" sections)
-3. phone_number: Phone number (look for phone patterns, "Tel:", "Telefon:", international formats)
-4. address: Physical address or location information (look for address patterns, street names, cities)
-5. about_us_text: Any about us, company description, mission statement, or service descriptions (in original language)
-
-EXTRACTION TIPS:
-- Check headers, footers, navigation menus, and contact sections
-- Look for both English and German terms:
-  * Contact: "Contact", "Kontakt", "Reach us", "Kontaktieren Sie uns"
-  * About: "About", "About us", "Über uns", "Wir sind"
-  * Email: look for mailto: links, @ symbols, email addresses
-  * Legal: "Impressum" (German legal notice), "Datenschutz" (privacy policy)
-- Company names often appear in: <title>, <h1>, logos, footer copyright
-- For German content, preserve German text in about_us_text
-- Pay attention to the context information below
-
-CONTEXT INFORMATION:
-{context}
-
-HTML Content:
-{html}
-
-Return ONLY a JSON object with these exact keys. If a field is not found, use null for that field.
-
-Example format:
-{{
-    "company_name": "LeadLane",
-    "contact_email": "os@leadlane.de", 
-    "phone_number": "+49-123-456789",
-    "address": "Street Name, City, Germany",
-    "about_us_text": "German or English description here..."
-}}
-"""
-        return prompt
+        return context
     
     def extract_with_retry(self, state: PipelineState) -> PipelineState:
         """Extract with retry logic using corrective prompt."""
         if state["retry_count"] >= 1:
-            print("Maximum retry attempts reached")
+            logger.info("Maximum retry attempts reached")
             return state
         
-        print(f"Retrying extraction (attempt {state['retry_count'] + 1})")
+        logger.info(f"Retrying extraction (attempt {state['retry_count'] + 1})")
         
-        # Use a more specific prompt for retry
-        html = state["html"]
-        
-        # Preprocess HTML for retry
-        cleaned_html = HTMLProcessor.clean_html(html)
-        prompt = self._create_retry_prompt(cleaned_html)
+        # Reuse the cleaned HTML and context hints from the first attempt; only
+        # the prompt string is rebuilt on retry
+        cleaned_html = state.get("cleaned_html")
+        if cleaned_html is None:
+            cleaned_html = HTMLProcessor.clean_html(state["html"])
+            state["cleaned_html"] = cleaned_html
+        prompt = self._create_retry_prompt(
+            cleaned_html,
+            state.get("potential_emails"),
+            state.get("potential_phones"),
+        )
         
         try:
             response = self.client.models.generate_content(
                 model="gemini-2.5-flash",
-                contents=prompt
+                contents=prompt,
+                config=self._json_config
             )
-            response_text = response.text
-            
-            # Parse the JSON response
-            json_start = response_text.find('{')
-            json_end = response_text.rfind('}') + 1
-            
-            if json_start != -1 and json_end > json_start:
-                json_str = response_text[json_start:json_end]
-                extracted_data = json.loads(json_str)
-                
-                # Validate with Pydantic
-                company_info = CompanyInfo(**extracted_data)
-                state["extracted_data"] = company_info.model_dump()
-                state["validated"] = True
-                
-                print("Retry extraction successful")
-                
+
+            if isinstance(response.parsed, CompanyInfo):
+                company_info = response.parsed
             else:
-                state["validated"] = False
-                state["extracted_data"] = None
-                
+                # Validate with Pydantic
+                company_info = CompanyInfo(**orjson.loads(response.text))
+
+            state["extracted_data"] = company_info.model_dump()
+            state["validated"] = True
+
+            logger.info("Retry extraction successful")
+
         except Exception as e:
-            print(f"Retry extraction failed: {str(e)}")
+            logger.error(f"Retry extraction failed: {str(e)}")
             state["validated"] = False
             state["extracted_data"] = None
         
         state["retry_count"] += 1
         return state
     
-    def _create_retry_prompt(self, html: str) -> str:
+    def _create_retry_prompt(self, html: str, potential_emails: list = None, potential_phones: list = None) -> str:
         """Create a more specific prompt for retry attempts."""
-        prompt = f"""
-The previous extraction failed. Please try again with this HTML content and be very careful to return ONLY valid JSON.
-
-CRITICAL: This content may be in GERMAN or English. Look for both languages.
-
-Search specifically for:
-- Company name (usually in header, title, footer, or about section)
-- Email addresses (patterns like contact@, info@, support@, mailto: links)
-- Phone numbers (patterns like (xxx) xxx-xxxx, +x-xxx-xxx-xxxx, Tel:, Telefon:)
-- Address information (street, city, state, zip patterns, German addresses)
-- About us/description text (paragraphs describing the company, in original language)
-
-GERMAN-SPECIFIC SEARCH TERMS:
-- "Kontakt" = Contact
-- "Über uns" = About us  
-- "Impressum" = Legal notice/imprint
-- "Datenschutz" = Privacy policy
-- "Sprechen Sie uns an" = Contact us
-- "Wir freuen uns" = We look forward to
+        context = self._create_context(potential_emails, potential_phones)
 
-HTML Content:
-{html}
-
-Return ONLY a valid JSON object. No explanations, no markdown formatting, just the JSON.
-"""
-        return prompt
+        return _RETRY_PROMPT_HEAD + context + "\n\nHTML Content:\n" + html + _RETRY_PROMPT_TAIL
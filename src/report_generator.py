@@ -1,8 +1,11 @@
+import logging
 import os
 from datetime import datetime
 from typing import Dict, Any
 from .state import PipelineState
 
+logger = logging.getLogger(__name__)
+
 
 class ReportGenerator:
     """Generates structured compliance reports."""
@@ -28,7 +31,7 @@ class ReportGenerator:
             f.write(report_content)
         
         state["report"] = report_content
-        print(f"Report generated: {report_path}")
+        logger.info(f"Report generated: {report_path}")
         
         return state
     
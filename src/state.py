@@ -1,10 +1,14 @@
-from typing import TypedDict, Optional, Dict, Any
+from typing import TypedDict, Optional, Dict, Any, List
 
 
 class PipelineState(TypedDict):
     """State object for the compliance evidence pipeline."""
     url: str
     html: Optional[str]
+    _html_hash: Optional[str]
+    cleaned_html: Optional[str]
+    potential_emails: Optional[List[str]]
+    potential_phones: Optional[List[str]]
     extracted_data: Optional[Dict[str, Any]]
     validated: bool
     retry_count: int
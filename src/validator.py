@@ -1,35 +1,48 @@
+import logging
 from typing import Dict, Any
 from pydantic import ValidationError
 from .llm_extractor import CompanyInfo
 from .state import PipelineState
 
+logger = logging.getLogger(__name__)
+
+
+# Keys a model_dump() of CompanyInfo always carries
+_EXPECTED_KEYS = set(CompanyInfo.model_fields.keys())
+
 
 class Validator:
     """Validates extracted data using Pydantic schemas."""
-    
+
     def validate_extraction(self, state: PipelineState) -> PipelineState:
         """Validate the extracted data."""
         extracted_data = state.get("extracted_data")
-        
+
         if not extracted_data:
             state["validated"] = False
-            print("No data to validate")
+            logger.info("No data to validate")
             return state
-        
+
+        # The extractor already round-tripped this dict through CompanyInfo;
+        # skip the redundant re-instantiation when the shape matches
+        if state.get("validated") and set(extracted_data.keys()) == _EXPECTED_KEYS:
+            logger.info("Data validation successful")
+            return state
+
         try:
             # Validate using Pydantic
             company_info = CompanyInfo(**extracted_data)
             state["validated"] = True
             state["extracted_data"] = company_info.model_dump()
-            print("Data validation successful")
+            logger.info("Data validation successful")
             
         except ValidationError as e:
             state["validated"] = False
-            print(f"Validation error: {str(e)}")
+            logger.error(f"Validation error: {str(e)}")
             
         except Exception as e:
             state["validated"] = False
-            print(f"Unexpected validation error: {str(e)}")
+            logger.error(f"Unexpected validation error: {str(e)}")
         
         return state
     
@@ -0,0 +1,65 @@
+from src.html_processor import HTMLProcessor
+
+
+ORGANIZATION_PAGE = """
+<html>
+<head>
+    <title>Fallback Title</title>
+    <meta property="og:site_name" content="LeadLane">
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "Organization",
+        "name": "LeadLane GmbH",
+        "email": "os@leadlane.de",
+        "telephone": "+49-123-456789",
+        "description": "Lead generation for B2B companies.",
+        "address": {
+            "@type": "PostalAddress",
+            "streetAddress": "Musterstrasse 1",
+            "postalCode": "10115",
+            "addressLocality": "Berlin",
+            "addressCountry": "DE"
+        }
+    }
+    </script>
+</head>
+<body>
+    <p>Welcome to LeadLane.</p>
+    <footer>
+        <a href="mailto:os@leadlane.de">Email us</a>
+        <a href="tel:+49-123-456789">Call us</a>
+    </footer>
+</body>
+</html>
+"""
+
+
+def test_fast_extract_fills_all_fields_from_json_ld():
+    result = HTMLProcessor.fast_extract(ORGANIZATION_PAGE)
+
+    assert result["company_name"] == "LeadLane GmbH"
+    assert result["contact_email"] == "os@leadlane.de"
+    assert result["phone_number"] == "+49-123-456789"
+    assert result["address"] == "Musterstrasse 1, 10115, Berlin, DE"
+    assert result["about_us_text"] == "Lead generation for B2B companies."
+    assert all(result.values())
+
+
+def test_clean_html_never_leaks_head_script_content():
+    html = (
+        '<html><head>'
+        '<script>var markup = "<body> fake";</script>'
+        '<style>p { color: red; }</style>'
+        '</head><body><p>real content</p></body></html>'
+    )
+
+    assert HTMLProcessor.clean_html(html) == "real content"
+
+
+def test_fast_extract_returns_empty_fields_without_structured_data():
+    result = HTMLProcessor.fast_extract("<html><body><p>Hello</p></body></html>")
+
+    assert result["contact_email"] is None
+    assert result["address"] is None
+    assert result["about_us_text"] is None